@@ -0,0 +1,113 @@
+# cython: language_level=3
+"""
+Compiled versions of the trip update and alert `to_clean_dict` conversions.
+
+Each function mirrors the pure-Python method on the matching fetcher in
+`fetch_realtime.py` and must produce identical output. Positions have no
+compiled version: they are cleaned in one place, `iter_clean_rows`. Build in
+place with:
+
+    cythonize -i scripts/_clean_fast.pyx
+
+When the extension is not built, the fetchers fall back to their
+pure-Python implementations.
+"""
+from cpython.list cimport PyList_Append
+
+from google.transit import gtfs_realtime_pb2
+
+from utils import intern_str
+
+
+cpdef list clean_trip_updates(feed):
+    """
+    Compiled equivalent of `TripUpdatesFetcher.to_clean_dict`.
+
+    Args:
+        feed (gtfs_realtime_pb2.FeedMessage): Parsed trip updates feed.
+
+    Returns:
+        list[dict]: List of cleaned trip update entries.
+    """
+    cdef list trips = []
+    cdef list stop_updates
+    cdef object entity, tu, s, arrival, departure
+    cdef bint has_arrival, has_departure
+    for entity in feed.entity:
+        if not entity.HasField("trip_update"):
+            continue
+
+        tu = entity.trip_update
+        stop_updates = []
+        for s in tu.stop_time_update:
+            has_arrival = s.HasField("arrival")
+            has_departure = s.HasField("departure")
+            arrival = s.arrival
+            departure = s.departure
+            PyList_Append(
+                stop_updates,
+                {
+                    "stop_id": intern_str(s.stop_id),
+                    "arrival": arrival.time if has_arrival else None,
+                    "departure": departure.time if has_departure else None,
+                    "arrival_delay": arrival.delay if has_arrival else None,
+                    "departure_delay": departure.delay if has_departure else None,
+                },
+            )
+        PyList_Append(
+            trips,
+            {
+                "trip_id": intern_str(tu.trip.trip_id),
+                "route_id": intern_str(tu.trip.route_id),
+                "stop_time_updates": stop_updates,
+            },
+        )
+    return trips
+
+
+cpdef list clean_alerts(feed):
+    """
+    Compiled equivalent of `AlertsFetcher.to_clean_dict`.
+
+    Args:
+        feed (gtfs_realtime_pb2.FeedMessage): Parsed alerts feed.
+
+    Returns:
+        list[dict]: List of cleaned alert entries.
+    """
+    cdef list alerts = []
+    cdef list informed
+    cdef object entity, alert, i, trip, header_trans, description_trans
+    cdef object cause_name = gtfs_realtime_pb2.Alert.Cause.Name
+    cdef object effect_name = gtfs_realtime_pb2.Alert.Effect.Name
+    for entity in feed.entity:
+        if not entity.HasField("alert"):
+            continue
+
+        alert = entity.alert
+
+        informed = []
+        for i in alert.informed_entity:
+            trip = i.trip
+            PyList_Append(
+                informed,
+                {
+                    "trip_id": intern_str(trip.trip_id) or None,
+                    "route_id": intern_str(i.route_id) or None,
+                    "stop_id": intern_str(i.stop_id) or None,
+                },
+            )
+
+        header_trans = alert.header_text.translation
+        description_trans = alert.description_text.translation
+        PyList_Append(
+            alerts,
+            {
+                "cause": cause_name(alert.cause),
+                "effect": effect_name(alert.effect),
+                "header": header_trans[0].text if header_trans else "",
+                "description": description_trans[0].text if description_trans else "",
+                "informed_entities": informed,
+            },
+        )
+    return alerts
@@ -1,16 +1,43 @@
-from datetime import datetime
-import requests
 import os
-import logging
-from google.transit import gtfs_realtime_pb2
-from google.protobuf.json_format import MessageToDict
-from dotenv import load_dotenv
-from file_saver import FileSaver
-from abc import ABC, abstractmethod
-from utils import LogObfuscator
+
+# Prefer the compiled upb protobuf backend; this must be set before protobuf is imported.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
+import asyncio  # noqa: E402
+import itertools  # noqa: E402
+import json  # noqa: E402
+from pathlib import Path  # noqa: E402
+from concurrent.futures import ThreadPoolExecutor, as_completed  # noqa: E402
+import aiohttp  # noqa: E402
+import urllib3  # noqa: E402
+from urllib3.util.retry import Retry  # noqa: E402
+import logging  # noqa: E402
+from google.transit import gtfs_realtime_pb2  # noqa: E402
+from google.protobuf.internal import api_implementation  # noqa: E402
+from google.protobuf.json_format import MessageToJson  # noqa: E402
+from dotenv import load_dotenv  # noqa: E402
+from file_saver import FileSaver  # noqa: E402
+from abc import ABC, abstractmethod  # noqa: E402
+from utils import ObfuscatingFormatter, intern_str, run_timestamp  # noqa: E402
+
+try:
+    import _clean_fast  # noqa: E402
+except ImportError:
+    _clean_fast = None
 
 load_dotenv()
 
+# Read the API key once; the endpoints and console formatter are built from it.
+_API_KEY = os.environ["TRANSLINK_API_KEY"]
+_CONSOLE_FORMATTER = ObfuscatingFormatter([_API_KEY])
+
+POSITIONS_URL = f"https://gtfsapi.translink.ca/v3/gtfsposition?apikey={_API_KEY}"
+TRIP_UPDATES_URL = f"https://gtfsapi.translink.ca/v3/gtfsrealtime?apikey={_API_KEY}"
+ALERTS_URL = f"https://gtfsapi.translink.ca/v3/gtfsalerts?apikey={_API_KEY}"
+# Overall limit in seconds on one async feed request, so a trickling response
+# cannot hold up the run.
+FETCH_TIMEOUT = 30
+
 
 class RealtimeFetcher(ABC):
     """
@@ -19,52 +46,56 @@ class RealtimeFetcher(ABC):
     This class provides the common workflow:
     - fetch raw bytes from a remote endpoint
     - parse the protobuf feed
-    - save raw JSON
+    - save the raw feed (protobuf bytes or compact JSON)
     - save cleaned/normalized JSON
 
     Subclasses must implement: `to_clean_dict`, `save_raw`, and `save_clean`.
 
     Args:
         endpoint (str): URL to fetch the realtime feed from.
-        now (str): Timestamp string used to name logs and output folders.
-        raw_dir (str): Directory path for saving raw feed JSON.
+        now (str): Timestamp string used to name output files.
+        raw_dir (str): Directory path for saving the raw feed.
         clean_dir (str): Directory path for saving cleaned feed JSON.
         timeout (int): HTTP request timeout in seconds.
-        session (requests.Session): Optional session to reuse for requests.
+        pool (urllib3.PoolManager): Optional connection pool to share between
+            fetchers. Requests go straight through urllib3, skipping the
+            per-call overhead of `requests`. If not given, one is created on
+            the first `fetch_raw` call, so async-only fetchers never build one.
+        raw_format (str): Raw archive format, either "pb" (the fetched
+            protobuf bytes, written as-is) or "json" (compact protobuf JSON).
+        logger (logging.Logger): Parent logger, normally the one configured by
+            `init_logging`. Records are logged through a child named after the
+            fetcher class, so no handlers are attached per instance.
     """
 
-    def __init__(self, endpoint, now, raw_dir, clean_dir, timeout=5, session=None):
-        self._init_logger(now)
-        self.session = session or requests.Session()
+    def __init__(
+        self,
+        endpoint,
+        now,
+        raw_dir,
+        clean_dir,
+        timeout=5,
+        pool=None,
+        raw_format="pb",
+        logger=None,
+    ):
+        if raw_format not in ("pb", "json"):
+            raise ValueError(f"Unsupported raw_format: {raw_format}")
+        parent = logger or logging.getLogger("Realtime")
+        self.logger = parent.getChild(self.__class__.__name__)
+        self.pool = pool
         self.endpoint = endpoint
         self.timeout = timeout
+        self.raw_format = raw_format
+
+        # HTTP cache validators from the last successful fetch, persisted next
+        # to the raw output so they survive between runs.
+        self._validators_path = Path(raw_dir) / ".http_validators.json"
+        self._last_etag, self._last_modified = self._load_validators()
 
         self.raw_file_saver = FileSaver(raw_dir, now)
         self.clean_file_saver = FileSaver(clean_dir, now)
 
-    def _init_logger(self, now):
-        """
-        Initialize a logger specific to this fetcher instance.
-
-        Creates a file logger and a console logger, with optional API-key
-        obfuscation applied through LogObfuscator.
-
-        Args:
-            now (str): Timestamp string used to name the log file.
-        """
-        self.logger = logging.getLogger(self.__class__.__name__)
-        self.logger.setLevel(logging.INFO)
-        fh = logging.FileHandler(f"data/runs/realtime_{now}.log")
-        fh.setLevel(logging.INFO)
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
-        fh.setFormatter(formatter)
-        ch = logging.StreamHandler()
-        ch.addFilter(LogObfuscator([os.getenv("TRANSLINK_API_KEY")]))
-        self.logger.addHandler(fh)
-        self.logger.addHandler(ch)
-
     @abstractmethod
     def to_clean_dict(self, feed):
         """
@@ -79,12 +110,13 @@ class RealtimeFetcher(ABC):
         pass
 
     @abstractmethod
-    def save_raw(self, feed):
+    def save_raw(self, feed, raw_bytes):
         """
-        Save the raw GTFS feed (converted to a dict) to disk (data/raw).
+        Save the raw GTFS feed to disk (data/raw).
 
         Args:
             feed (gtfs_realtime_pb2.FeedMessage): Parsed protobuf feed.
+            raw_bytes (bytes): Protobuf bytes the feed was parsed from.
         """
         pass
 
@@ -98,35 +130,154 @@ class RealtimeFetcher(ABC):
         """
         pass
 
+    def _load_validators(self):
+        """
+        Load the ETag and Last-Modified values saved by a previous run.
+
+        Returns:
+            tuple[str | None, str | None]: ETag and Last-Modified, or None for
+            any value that is missing or unreadable.
+        """
+        try:
+            with open(self._validators_path, encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return None, None
+        return saved.get("etag"), saved.get("last_modified")
+
+    def _conditional_headers(self):
+        """
+        Build conditional GET headers from the last known validators.
+
+        Returns:
+            dict: `If-None-Match` / `If-Modified-Since` headers, possibly empty.
+        """
+        headers = {}
+        if self._last_etag:
+            headers["If-None-Match"] = self._last_etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
+        return headers
+
+    def _remember_validators(self, validators):
+        """
+        Store the ETag and Last-Modified of a processed response for the next fetch.
+
+        Only called once the response has been parsed and saved, so a failed
+        run is fetched again in full instead of being skipped as unchanged.
+
+        Args:
+            validators (tuple[str | None, str | None]): ETag and Last-Modified
+                returned by `fetch_raw` / `afetch_raw`.
+        """
+        etag, last_modified = validators
+        if (etag, last_modified) == (self._last_etag, self._last_modified):
+            return
+        self._last_etag, self._last_modified = etag, last_modified
+        try:
+            with open(self._validators_path, "w", encoding="utf-8") as f:
+                json.dump({"etag": etag, "last_modified": last_modified}, f)
+        except OSError:
+            self.logger.warning("Could not save HTTP validators.", exc_info=True)
+
     def fetch_raw(self):
         """
         Fetch raw GTFS-Realtime bytes from the configured endpoint.
 
+        Sends a conditional GET using the validators of the previous fetch.
+
         Returns:
-            bytes: Raw protobuf response content.
+            tuple[bytes | None, tuple[str | None, str | None]]: Raw protobuf
+            response content (None if the feed has not changed since the
+            previous fetch, HTTP 304) and the response's ETag and Last-Modified.
 
         Raises:
-            requests.exceptions.Timeout: Request exceeded timeout.
-            requests.exceptions.HTTPError: Non-200 response.
-            requests.exceptions.ConnectionError: Network issue.
+            urllib3.exceptions.MaxRetryError: Timeout or network issue that
+                persisted through the pool's retries.
+            urllib3.exceptions.HTTPError: Error (4xx/5xx) response.
             Exception: Any unexpected error.
         """
+        if self.pool is None:
+            self.pool = make_pool()
         try:
-            self.logger.info(f"Fetching from f{self.endpoint}")
-            r = self.session.get(self.endpoint, timeout=self.timeout)
-            r.raise_for_status()
+            self.logger.info(f"Fetching from {self.endpoint}")
+            r = self.pool.request(
+                "GET",
+                self.endpoint,
+                headers=self._conditional_headers(),
+                timeout=self.timeout,
+                preload_content=True,
+            )
+        except urllib3.exceptions.MaxRetryError as e:
+            if isinstance(e.reason, urllib3.exceptions.TimeoutError):
+                self.logger.error(
+                    "Timeout occurred while fetching feed.", exc_info=True
+                )
+            else:
+                self.logger.error(f"Connection error: {e.reason}", exc_info=True)
+            raise
+        except Exception as e:
+            self.logger.exception(f"Unexpected error while fetching feed: {e}")
+            raise
+
+        if r.status == 304:
+            self.logger.info("Feed not modified; skipping.")
+            return None, (None, None)
+        if r.status >= 400:
+            self.logger.error(f"HTTP error {r.status} while fetching feed.")
+            raise urllib3.exceptions.HTTPError(
+                f"HTTP error {r.status} while fetching feed"
+            )
+        self.logger.info("Fetch successful.")
+        return r.data, (r.headers.get("ETag"), r.headers.get("Last-Modified"))
+
+    async def afetch_raw(self, session):
+        """
+        Asynchronously fetch raw GTFS-Realtime bytes from the configured endpoint.
+
+        Async counterpart of `fetch_raw`, used when several downloads share one
+        event loop.
+
+        Args:
+            session (aiohttp.ClientSession): Session to issue the request on.
+
+        Returns:
+            tuple[bytes | None, tuple[str | None, str | None]]: Raw protobuf
+            response content (None if the feed has not changed since the
+            previous fetch, HTTP 304) and the response's ETag and Last-Modified.
+
+        Raises:
+            asyncio.TimeoutError: Request stalled or exceeded `FETCH_TIMEOUT`.
+            aiohttp.ClientResponseError: Error (4xx/5xx) response.
+            aiohttp.ClientConnectionError: Network issue.
+            Exception: Any unexpected error.
+        """
+        timeout = aiohttp.ClientTimeout(
+            total=FETCH_TIMEOUT, sock_connect=self.timeout, sock_read=self.timeout
+        )
+        try:
+            self.logger.info(f"Fetching from {self.endpoint}")
+            async with session.get(
+                self.endpoint, headers=self._conditional_headers(), timeout=timeout
+            ) as r:
+                if r.status == 304:
+                    self.logger.info("Feed not modified; skipping.")
+                    return None, (None, None)
+                r.raise_for_status()
+                raw = await r.read()
+                validators = (r.headers.get("ETag"), r.headers.get("Last-Modified"))
             self.logger.info("Fetch successful.")
-            return r.content
-        except requests.exceptions.Timeout:
+            return raw, validators
+        except asyncio.TimeoutError:
             self.logger.error("Timeout occurred while fetching feed.", exc_info=True)
             raise
-        except requests.exceptions.HTTPError as e:
+        except aiohttp.ClientResponseError as e:
             self.logger.error(
-                f"HTTP error {e.response.status_code} while fetching feed: {e}",
+                f"HTTP error {e.status} while fetching feed: {e.message}",
                 exc_info=True,
             )
             raise
-        except requests.exceptions.ConnectionError as e:
+        except aiohttp.ClientConnectionError as e:
             self.logger.error(f"Connection error: {e}", exc_info=True)
             raise
         except Exception as e:
@@ -147,18 +298,27 @@ class RealtimeFetcher(ABC):
         feed.ParseFromString(raw_bytes)
         return feed
 
-    def to_raw_dict(self, feed):
+    def _save_raw_archive(self, source, feed, raw_bytes):
         """
-        Convert a FeedMessage object into a raw dictionary using protobuf's JSON formatter.
+        Write the raw feed in the configured `raw_format`.
+
+        The "pb" format writes the fetched bytes without re-serializing them.
+        The "json" format serializes the feed once with protobuf's own JSON
+        formatter (C under the upb backend) and writes the string as-is, with
+        no intermediate dict.
 
         Args:
+            source (str): Name used to generate the filename.
             feed (gtfs_realtime_pb2.FeedMessage): Parsed feed.
-
-        Returns:
-            dict: JSON-serializable dictionary matching the GTFS-Realtime format.
+            raw_bytes (bytes): Protobuf bytes the feed was parsed from.
         """
-        feed_dict = MessageToDict(feed)
-        return feed_dict
+        if self.raw_format == "pb":
+            self.raw_file_saver.save_bytes(source, "pb", raw_bytes)
+        else:
+            self.raw_file_saver.save_text(
+                source,
+                MessageToJson(feed, preserving_proto_field_name=True, indent=None),
+            )
 
     def run(self):
         """
@@ -167,12 +327,40 @@ class RealtimeFetcher(ABC):
         Steps:
             1. fetch raw bytes
             2. parse protobuf feed
-            3. save raw JSON
+            3. save raw feed
             4. save cleaned JSON
+
+        Stops after step 1 if the feed has not changed since the last fetch.
+        """
+        raw, validators = self.fetch_raw()
+        if raw is not None:
+            self.process(raw)
+            self._remember_validators(validators)
+
+    async def arun(self, session):
+        """
+        Async counterpart of `run`.
+
+        The download is awaited on the event loop; parsing and saving are
+        CPU/disk work and run in a worker thread so other downloads proceed.
+
+        Args:
+            session (aiohttp.ClientSession): Session to issue the request on.
+        """
+        raw, validators = await self.afetch_raw(session)
+        if raw is not None:
+            await asyncio.to_thread(self.process, raw)
+            self._remember_validators(validators)
+
+    def process(self, raw):
+        """
+        Parse fetched bytes and save the raw and cleaned outputs.
+
+        Args:
+            raw (bytes): Raw protobuf response content.
         """
-        raw = self.fetch_raw()
         feed = self.parse(raw)
-        self.save_raw(feed)
+        self.save_raw(feed, raw)
         self.save_clean(feed)
 
 
@@ -181,54 +369,130 @@ class PositionsFetcher(RealtimeFetcher):
     Fetcher for GTFS-Realtime vehicle position updates.
 
     Fetches vehicle positions, extracts latitude/longitude and trip metadata,
-    and stores both raw and cleaned outputs.
+    and stores both raw and cleaned outputs. Cleaned positions are written as
+    columnar Parquet by default; pass `clean_format="csv"` for CSV rows or
+    `clean_format="json"` for a JSON list of records instead.
     """
 
-    def __init__(self, session, now=None, timeout=5):
-        endpoint = f"https://gtfsapi.translink.ca/v3/gtfsposition?apikey={os.getenv('TRANSLINK_API_KEY')}"
+    # Field order of cleaned position rows and columns.
+    FIELDNAMES = ("vehicle_id", "trip_id", "route_id", "lat", "lon", "timestamp")
+    # Arrow types for the cleaned columns; remaining columns are strings.
+    COLUMN_TYPES = {"lat": "float32", "lon": "float32", "timestamp": "uint32"}
+
+    def __init__(
+        self,
+        pool=None,
+        now=None,
+        timeout=5,
+        raw_format="pb",
+        clean_format="parquet",
+        logger=None,
+    ):
+        if clean_format not in ("parquet", "csv", "json"):
+            raise ValueError(f"Unsupported clean_format: {clean_format}")
         super().__init__(
-            endpoint,
+            POSITIONS_URL,
             raw_dir="data/raw/realtime/position_updates",
             clean_dir="data/clean/realtime/position_updates",
             now=now,
             timeout=timeout,
-            session=session,
+            pool=pool,
+            raw_format=raw_format,
+            logger=logger,
         )
+        self.clean_format = clean_format
 
-    def to_clean_dict(self, feed):
+    def iter_clean_rows(self, feed):
         """
-        Convert a vehicle positions feed into a list of cleaned position records.
+        Yield cleaned vehicle position tuples.
+
+        Each row holds the values of `FIELDNAMES` in order, with repeated IDs
+        interned. Rows are produced lazily so they can be streamed straight
+        into a CSV writer without materializing the whole cleaned feed. This
+        is the one place positions are cleaned; `to_clean_columns` and
+        `to_clean_dict` reshape its rows.
 
         Args:
             feed (gtfs_realtime_pb2.FeedMessage): Parsed positions feed.
 
-        Returns:
-            list[dict]: Cleaned vehicle position entries.
+        Yields:
+            tuple: One cleaned vehicle position row.
         """
-        positions = []
         for entity in feed.entity:
             if not entity.HasField("vehicle"):
                 continue
 
             v = entity.vehicle
+            trip = v.trip
+            if v.HasField("position"):
+                pos = v.position
+                lat, lon = pos.latitude, pos.longitude
+            else:
+                lat = lon = None
+
+            yield (
+                intern_str(v.vehicle.id) or None,
+                intern_str(trip.trip_id) or None,
+                intern_str(trip.route_id) or None,
+                lat,
+                lon,
+                v.timestamp or None,
+            )
 
-            positions.append(
-                {
-                    "vehicle_id": v.vehicle.id or None,
-                    "trip_id": v.trip.trip_id or None,
-                    "route_id": v.trip.route_id or None,
-                    "lat": v.position.latitude if v.HasField("position") else None,
-                    "lon": v.position.longitude if v.HasField("position") else None,
-                    "timestamp": v.timestamp if v.timestamp else None,
-                }
+    def to_clean_columns(self, feed):
+        """
+        Convert a vehicle positions feed into parallel column lists.
+
+        Produces the same fields as `to_clean_dict`, but as one list per field,
+        ready for columnar storage.
+
+        Args:
+            feed (gtfs_realtime_pb2.FeedMessage): Parsed positions feed.
+
+        Returns:
+            dict[str, list]: Field name to column values.
+        """
+        columns = zip(*self.iter_clean_rows(feed))
+        # zip_longest keeps every (empty) column when there are no vehicles.
+        return {
+            name: list(values)
+            for name, values in itertools.zip_longest(
+                self.FIELDNAMES, columns, fillvalue=()
             )
-        return positions
+        }
 
-    def save_raw(self, feed):
-        self.raw_file_saver.save_json("position_updates", self.to_raw_dict(feed))
+    def to_clean_dict(self, feed):
+        """
+        Convert a vehicle positions feed into a list of cleaned position records.
+
+        Args:
+            feed (gtfs_realtime_pb2.FeedMessage): Parsed positions feed.
+
+        Returns:
+            list[dict]: Cleaned vehicle position entries.
+        """
+        fieldnames = self.FIELDNAMES
+        return [dict(zip(fieldnames, row)) for row in self.iter_clean_rows(feed)]
+
+    def save_raw(self, feed, raw_bytes):
+        self._save_raw_archive("position_updates", feed, raw_bytes)
 
     def save_clean(self, feed):
-        self.clean_file_saver.save_json("position_updates", self.to_clean_dict(feed))
+        if self.clean_format == "parquet":
+            self.clean_file_saver.save_parquet(
+                "position_updates", self.to_clean_columns(feed), self.COLUMN_TYPES
+            )
+        elif self.clean_format == "csv":
+            self.clean_file_saver.save_csv(
+                "position_updates",
+                self.iter_clean_rows(feed),
+                fieldnames=self.FIELDNAMES,
+                fast=True,
+            )
+        else:
+            self.clean_file_saver.save_json(
+                "position_updates", self.to_clean_dict(feed), compress="zstd"
+            )
 
 
 class TripUpdatesFetcher(RealtimeFetcher):
@@ -236,18 +500,75 @@ class TripUpdatesFetcher(RealtimeFetcher):
     Fetcher for GTFS-Realtime trip updates.
 
     Extracts arrival/departure times, delays, and associated trip metadata.
+    Cleaned output is nested JSON by default; pass `clean_format="csv"` for
+    one flat row per stop time update.
     """
 
-    def __init__(self, session, now=None, timeout=5):
-        endpoint = f"https://gtfsapi.translink.ca/v3/gtfsrealtime?apikey={os.getenv('TRANSLINK_API_KEY')}"
+    # Field order of flattened stop time update rows.
+    FIELDNAMES = (
+        "trip_id",
+        "route_id",
+        "stop_id",
+        "arrival",
+        "departure",
+        "arrival_delay",
+        "departure_delay",
+    )
+
+    def __init__(
+        self,
+        pool=None,
+        now=None,
+        timeout=5,
+        raw_format="pb",
+        clean_format="json",
+        logger=None,
+    ):
+        if clean_format not in ("json", "csv"):
+            raise ValueError(f"Unsupported clean_format: {clean_format}")
         super().__init__(
-            endpoint,
+            TRIP_UPDATES_URL,
             raw_dir="data/raw/realtime/trip_updates",
             clean_dir="data/clean/realtime/trip_updates",
             now=now,
             timeout=timeout,
-            session=session,
+            pool=pool,
+            raw_format=raw_format,
+            logger=logger,
         )
+        self.clean_format = clean_format
+
+    def iter_clean_rows(self, feed):
+        """
+        Yield one flat tuple per stop time update, in `FIELDNAMES` order.
+
+        IDs are interned, as in `to_clean_dict`.
+
+        Args:
+            feed (gtfs_realtime_pb2.FeedMessage): Parsed trip updates feed.
+
+        Yields:
+            tuple: One cleaned stop time update row.
+        """
+        for entity in feed.entity:
+            if not entity.HasField("trip_update"):
+                continue
+
+            tu = entity.trip_update
+            trip_id = intern_str(tu.trip.trip_id)
+            route_id = intern_str(tu.trip.route_id)
+            for s in tu.stop_time_update:
+                has_arrival = s.HasField("arrival")
+                has_departure = s.HasField("departure")
+                yield (
+                    trip_id,
+                    route_id,
+                    intern_str(s.stop_id),
+                    s.arrival.time if has_arrival else None,
+                    s.departure.time if has_departure else None,
+                    s.arrival.delay if has_arrival else None,
+                    s.departure.delay if has_departure else None,
+                )
 
     def to_clean_dict(self, feed):
         """
@@ -259,6 +580,9 @@ class TripUpdatesFetcher(RealtimeFetcher):
         Returns:
             list[dict]: List of cleaned trip update entries.
         """
+        if _clean_fast is not None:
+            return _clean_fast.clean_trip_updates(feed)
+
         trips = []
         for entity in feed.entity:
             if not entity.HasField("trip_update"):
@@ -269,7 +593,7 @@ class TripUpdatesFetcher(RealtimeFetcher):
             for s in tu.stop_time_update:
                 stop_updates.append(
                     {
-                        "stop_id": s.stop_id,
+                        "stop_id": intern_str(s.stop_id),
                         "arrival": s.arrival.time if s.HasField("arrival") else None,
                         "departure": (
                             s.departure.time if s.HasField("departure") else None
@@ -284,18 +608,28 @@ class TripUpdatesFetcher(RealtimeFetcher):
                 )
             trips.append(
                 {
-                    "trip_id": tu.trip.trip_id,
-                    "route_id": tu.trip.route_id,
+                    "trip_id": intern_str(tu.trip.trip_id),
+                    "route_id": intern_str(tu.trip.route_id),
                     "stop_time_updates": stop_updates,
                 }
             )
         return trips
 
-    def save_raw(self, feed):
-        self.raw_file_saver.save_json("trip_updates", self.to_raw_dict(feed))
+    def save_raw(self, feed, raw_bytes):
+        self._save_raw_archive("trip_updates", feed, raw_bytes)
 
     def save_clean(self, feed):
-        self.clean_file_saver.save_json("trip_updates", self.to_clean_dict(feed))
+        if self.clean_format == "csv":
+            self.clean_file_saver.save_csv(
+                "trip_updates",
+                self.iter_clean_rows(feed),
+                fieldnames=self.FIELDNAMES,
+                fast=True,
+            )
+        else:
+            self.clean_file_saver.save_json(
+                "trip_updates", self.to_clean_dict(feed), compress="zstd"
+            )
 
 
 class AlertsFetcher(RealtimeFetcher):
@@ -305,15 +639,16 @@ class AlertsFetcher(RealtimeFetcher):
     Extracts alert cause/effect, description, and informed entities.
     """
 
-    def __init__(self, session, now=None, timeout=5):
-        endpoint = f"https://gtfsapi.translink.ca/v3/gtfsalerts?apikey={os.getenv('TRANSLINK_API_KEY')}"
+    def __init__(self, pool=None, now=None, timeout=5, raw_format="pb", logger=None):
         super().__init__(
-            endpoint,
+            ALERTS_URL,
             raw_dir="data/raw/realtime/service_alerts",
             clean_dir="data/clean/realtime/service_alerts",
             now=now,
             timeout=timeout,
-            session=session,
+            pool=pool,
+            raw_format=raw_format,
+            logger=logger,
         )
 
     def to_clean_dict(self, feed):
@@ -326,7 +661,13 @@ class AlertsFetcher(RealtimeFetcher):
         Returns:
             list[dict]: List of cleaned alert entries.
         """
+        if _clean_fast is not None:
+            return _clean_fast.clean_alerts(feed)
+
         alerts = []
+        # Enum name lookups are bound once rather than resolved per alert.
+        cause_name = gtfs_realtime_pb2.Alert.Cause.Name
+        effect_name = gtfs_realtime_pb2.Alert.Effect.Name
         for entity in feed.entity:
             if not entity.HasField("alert"):
                 continue
@@ -335,27 +676,24 @@ class AlertsFetcher(RealtimeFetcher):
 
             informed = []
             for i in alert.informed_entity:
+                trip = i.trip
                 informed.append(
                     {
-                        "trip_id": i.trip.trip_id or None,
-                        "route_id": i.route_id or None,
-                        "stop_id": i.stop_id or None,
+                        "trip_id": intern_str(trip.trip_id) or None,
+                        "route_id": intern_str(i.route_id) or None,
+                        "stop_id": intern_str(i.stop_id) or None,
                     }
                 )
 
+            header_trans = alert.header_text.translation
+            description_trans = alert.description_text.translation
             alerts.append(
                 {
-                    "cause": gtfs_realtime_pb2.Alert.Cause.Name(alert.cause),
-                    "effect": gtfs_realtime_pb2.Alert.Effect.Name(alert.effect),
-                    "header": (
-                        alert.header_text.translation[0].text
-                        if alert.header_text.translation
-                        else ""
-                    ),
+                    "cause": cause_name(alert.cause),
+                    "effect": effect_name(alert.effect),
+                    "header": header_trans[0].text if header_trans else "",
                     "description": (
-                        alert.description_text.translation[0].text
-                        if alert.description_text.translation
-                        else ""
+                        description_trans[0].text if description_trans else ""
                     ),
                     "informed_entities": informed,
                 }
@@ -363,16 +701,43 @@ class AlertsFetcher(RealtimeFetcher):
 
         return alerts
 
-    def save_raw(self, feed):
-        self.raw_file_saver.save_json("service_alerts", self.to_raw_dict(feed))
+    def save_raw(self, feed, raw_bytes):
+        self._save_raw_archive("service_alerts", feed, raw_bytes)
 
     def save_clean(self, feed):
-        self.clean_file_saver.save_json("service_alerts", self.to_clean_dict(feed))
+        self.clean_file_saver.save_json(
+            "service_alerts", self.to_clean_dict(feed), compress="zstd"
+        )
+
+
+def make_pool():
+    """
+    Create the connection pool used for realtime fetches.
+
+    All realtime endpoints share one host, so a single pool with one
+    keep-alive connection per concurrent fetcher is enough. Transient
+    connection failures are retried with a short backoff.
+
+    Returns:
+        urllib3.PoolManager: Thread-safe connection pool.
+    """
+    return urllib3.PoolManager(
+        num_pools=1,
+        maxsize=4,
+        block=True,
+        retries=Retry(total=2, backoff_factor=0.1),
+    )
 
 
 def init_logging(now):
     """
-    Initialize a top-level logger for the realtime data pipeline.
+    Configure the shared logger for the realtime data pipeline.
+
+    The logger writes to a timestamped file under `data/runs/` and to the
+    console, with the API key obfuscated on the console. Fetchers log through
+    child loggers, so these are the only handlers. Calling this again (e.g. on
+    the next run in a long-lived process) replaces the previous handlers
+    instead of stacking new ones.
 
     Args:
         now (str): Timestamp string used to name the log file.
@@ -382,16 +747,50 @@ def init_logging(now):
     """
     logger = logging.getLogger("Realtime")
     logger.setLevel(logging.INFO)
-    fh = logging.FileHandler(f"data/runs/realtime_{now}.log")
-    fh.setLevel(logging.INFO)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+
     formatter = logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
+    fh = logging.FileHandler(f"data/runs/realtime_{now}.log", delay=True)
+    fh.setLevel(logging.INFO)
     fh.setFormatter(formatter)
+    ch = logging.StreamHandler()
+    ch.setFormatter(_CONSOLE_FORMATTER)
     logger.addHandler(fh)
+    logger.addHandler(ch)
     return logger
 
 
+def _setup_run(timestamp, **fetcher_kwargs):
+    """
+    Prepare logging and the three realtime fetchers for one run.
+
+    Args:
+        timestamp (str | None): Optional timestamp override. If not provided,
+            the current time is used.
+        **fetcher_kwargs: Extra keyword arguments passed to every fetcher.
+
+    Returns:
+        tuple[logging.Logger, list[RealtimeFetcher]]: Run logger and fetchers.
+    """
+    now = timestamp or run_timestamp()
+    logger = init_logging(now)
+    if api_implementation.Type() == "python":
+        logger.warning(
+            "Pure-Python protobuf backend in use; feed parsing will be slow."
+        )
+
+    fetchers = [
+        PositionsFetcher(now=now, logger=logger, **fetcher_kwargs),
+        TripUpdatesFetcher(now=now, logger=logger, **fetcher_kwargs),
+        AlertsFetcher(now=now, logger=logger, **fetcher_kwargs),
+    ]
+    return logger, fetchers
+
+
 def run(timestamp=None):
     """
     Run all realtime fetchers (positions, trip updates, service alerts).
@@ -403,20 +802,68 @@ def run(timestamp=None):
     Side Effects:
         Creates log files, fetches remote data, and writes raw/clean JSON output.
     """
-    now = timestamp or datetime.now().strftime("%Y-%m-%dT%H-%M")
-    logger = init_logging(now)
+    logger, fetchers = _setup_run(timestamp, pool=make_pool())
+
+    # Each fetcher is dominated by its network round-trip and writes to its own
+    # directories, so the three can run concurrently.
+    try:
+        with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+            futures = {}
+            for f in fetchers:
+                logger.info(f"Running {f.__class__.__name__}")
+                futures[executor.submit(f.run)] = f
+
+            for future in as_completed(futures):
+                future.result()
+                logger.info(f"{futures[future].__class__.__name__} complete.")
+    finally:
+        # Sync whatever was written, including the output of fetchers that
+        # succeeded when another one failed.
+        synced = FileSaver.finalize_batch()
+        logger.info(f"Synced {synced} output files.")
 
-    session = requests.Session()
+    logger.info("Run complete.")
 
-    fetchers = [
-        PositionsFetcher(session=session, now=now),
-        TripUpdatesFetcher(session=session, now=now),
-        AlertsFetcher(session=session, now=now),
-    ]
+
+async def run_async(session, timestamp=None):
+    """
+    Run all realtime fetchers on the current event loop.
+
+    Async counterpart of `run`: the three downloads are gathered on `session`
+    so they can share an event loop (and connection pool) with other
+    producers, such as the static feed download. Every fetcher is allowed to
+    finish before the first error, if any, is raised, so a retry never runs
+    alongside fetchers left over from the failed attempt.
+
+    Args:
+        session (aiohttp.ClientSession): Session to issue requests on.
+        timestamp (str | None): Optional timestamp override. If not provided,
+            the current time is used.
+
+    Side Effects:
+        Creates log files, fetches remote data, and writes raw/clean JSON output.
+    """
+    logger, fetchers = _setup_run(timestamp)
 
     for f in fetchers:
         logger.info(f"Running {f.__class__.__name__}")
-        f.run()
+    results = await asyncio.gather(
+        *(f.arun(session) for f in fetchers), return_exceptions=True
+    )
+    try:
+        for f, result in zip(fetchers, results):
+            if isinstance(result, BaseException):
+                logger.error(f"{f.__class__.__name__} failed: {result}")
+            else:
+                logger.info(f"{f.__class__.__name__} complete.")
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+    finally:
+        # Sync whatever was written, including the output of fetchers that
+        # succeeded when another one failed.
+        synced = await asyncio.to_thread(FileSaver.finalize_batch)
+        logger.info(f"Synced {synced} output files.")
 
     logger.info("Run complete.")
 
@@ -1,12 +1,22 @@
+import asyncio
+import aiohttp
 import requests
 import zipfile
-import io
 import os
-from datetime import datetime
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from utils import run_timestamp
 import logging
 
 URL = "https://gtfs-static.translink.ca/gtfs/google_transit.zip"
 BASE_OUTPUT_DIR = "data/raw/static"
+# Chunk size used when streaming the ZIP download to disk.
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+# Number of ZIP members inflated concurrently.
+EXTRACT_WORKERS = 4
+# Overall limit in seconds on the async ZIP download (extraction not included).
+DOWNLOAD_TIMEOUT = 300
 
 
 def init_logging(now):
@@ -15,6 +25,7 @@ def init_logging(now):
 
     Creates a timestamped log file under `data/runs/` and configures
     it to capture info-level events for the static GTFS download process.
+    Handlers from a previous call are replaced rather than stacked.
 
     Args:
         now (str): Timestamp string used to name the log file.
@@ -24,7 +35,10 @@ def init_logging(now):
     """
     logger = logging.getLogger("Static")
     logger.setLevel(logging.INFO)
-    fh = logging.FileHandler(f"data/runs/static_{now}.log")
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    fh = logging.FileHandler(f"data/runs/static_{now}.log", delay=True)
     fh.setLevel(logging.INFO)
     formatter = logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -34,15 +48,36 @@ def init_logging(now):
     return logger
 
 
+def extract(zip_path, output_dir, logger):
+    """
+    Extract every member of a GTFS ZIP archive into `output_dir`.
+
+    zlib releases the GIL while inflating, so members are extracted in
+    parallel on a small thread pool.
+
+    Args:
+        zip_path (str): Path to the downloaded ZIP file.
+        output_dir (str): Directory to extract into.
+        logger (logging.Logger): Logger for progress messages.
+    """
+    logger.info("Unzipping the file...")
+    with zipfile.ZipFile(zip_path) as zf, ThreadPoolExecutor(
+        max_workers=EXTRACT_WORKERS
+    ) as executor:
+        list(executor.map(lambda name: zf.extract(name, output_dir), zf.namelist()))
+    logger.info(f"Extraction completed to {output_dir}")
+
+
 def run(timestamp=None):
     """
     Download and extract the GTFS static data feed.
 
     This function:
         1. Creates an output directory timestamped with the run time.
-        2. Downloads the GTFS static ZIP file from TransLink.
+        2. Streams the GTFS static ZIP file from TransLink into a temporary
+           file in the output directory, so the archive is never held in memory.
         3. Validates the HTTP response.
-        4. Unzips the GTFS contents into the output directory.
+        4. Unzips the GTFS members into the output directory in parallel.
         5. Logs the progress and errors to a timestamped log file.
 
     Args:
@@ -54,7 +89,7 @@ def run(timestamp=None):
         zipfile.BadZipFile: If the downloaded file is not a valid ZIP.
         Exception: For any other unexpected errors.
     """
-    now = timestamp or datetime.now().strftime("%Y-%m-%dT%H-%M")
+    now = timestamp or run_timestamp()
     logger = init_logging(now)
     output_dir = os.path.join(BASE_OUTPUT_DIR, f"gtfs_static_{now}")
 
@@ -62,15 +97,16 @@ def run(timestamp=None):
         os.makedirs(output_dir, exist_ok=True)
         logger.info(f"Created output directory: {output_dir}")
 
-        logger.info(f"Fetching ZIP file from {URL}...")
-        response = requests.get(URL, timeout=10)
-        response.raise_for_status()
-        logger.info("Download successful!")
+        with tempfile.NamedTemporaryFile(dir=output_dir, suffix=".zip") as tmp:
+            logger.info(f"Fetching ZIP file from {URL}...")
+            with requests.get(URL, stream=True, timeout=10) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, tmp, length=DOWNLOAD_CHUNK_SIZE)
+            tmp.flush()
+            logger.info("Download successful!")
 
-        logger.info("Unzipping the file...")
-        with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
-            zf.extractall(output_dir)
-        logger.info(f"Extraction completed to {output_dir}")
+            extract(tmp.name, output_dir, logger)
 
     except requests.RequestException as e:
         logger.error(f"Failed to download the ZIP file: {e}")
@@ -83,5 +119,60 @@ def run(timestamp=None):
         raise
 
 
+async def run_async(session, timestamp=None):
+    """
+    Download and extract the GTFS static data feed on the current event loop.
+
+    Async counterpart of `run`. The download streams into a temporary file
+    while other requests on the loop proceed; extraction runs in a worker
+    thread.
+
+    Args:
+        session (aiohttp.ClientSession): Session to issue the request on.
+        timestamp (str | None): Optional override for the timestamp used in
+            directory/log naming. If not provided, the current time is used.
+
+    Raises:
+        aiohttp.ClientError: If the ZIP file cannot be downloaded.
+        asyncio.TimeoutError: If the download stalls or exceeds
+            `DOWNLOAD_TIMEOUT`.
+        zipfile.BadZipFile: If the downloaded file is not a valid ZIP.
+        Exception: For any other unexpected errors.
+    """
+    now = timestamp or run_timestamp()
+    logger = init_logging(now)
+    output_dir = os.path.join(BASE_OUTPUT_DIR, f"gtfs_static_{now}")
+    timeout = aiohttp.ClientTimeout(
+        total=DOWNLOAD_TIMEOUT, sock_connect=10, sock_read=10
+    )
+
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+        logger.info(f"Created output directory: {output_dir}")
+
+        with tempfile.NamedTemporaryFile(dir=output_dir, suffix=".zip") as tmp:
+            logger.info(f"Fetching ZIP file from {URL}...")
+            async with session.get(URL, timeout=timeout) as response:
+                response.raise_for_status()
+                async for chunk in response.content.iter_chunked(
+                    DOWNLOAD_CHUNK_SIZE
+                ):
+                    tmp.write(chunk)
+            tmp.flush()
+            logger.info("Download successful!")
+
+            await asyncio.to_thread(extract, tmp.name, output_dir, logger)
+
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.error(f"Failed to download the ZIP file: {e}")
+        raise
+    except zipfile.BadZipFile as e:
+        logger.error(f"The downloaded file is not a valid ZIP: {e}")
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error: {e}")
+        raise
+
+
 if __name__ == "__main__":
     run()
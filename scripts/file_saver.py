@@ -1,8 +1,119 @@
 import json
+import contextlib
 import csv
+import gzip
+import io
+import itertools
+import operator
+import os
+import re
+import tempfile
+import threading
 from pathlib import Path
-from datetime import datetime
-from typing import Any, Dict, List, Union
+from utils import run_timestamp
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import pyarrow
+    import pyarrow.csv
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# Write buffer size used for output files; large enough that a typical feed
+# is flushed in a handful of write() calls.
+WRITE_BUFFER_SIZE = 1024 * 1024
+# Filename suffix for each supported output compression.
+COMPRESSION_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+# Number of CSV rows handed to csv.writer.writerows at a time.
+CSV_CHUNK_ROWS = 4096
+# Row count from which save_csv_arrow hands off to pyarrow's CSV writer.
+ARROW_CSV_MIN_ROWS = 10_000
+# Characters of formatted CSV accumulated before each write on the fast path.
+FAST_CSV_FLUSH_CHARS = 8 * 1024 * 1024
+# Characters that force a CSV field to be quoted (csv.QUOTE_MINIMAL rules).
+_CSV_SPECIAL = re.compile(r'[,"\r\n]')
+# Process umask, read once at import (os.umask can only be read by setting it).
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _csv_field(value: Any) -> str:
+    """
+    Format one value the way `csv.writer` would with its default dialect.
+
+    Args:
+        value (Any): Field value.
+
+    Returns:
+        str: Formatted field, quoted only if it contains special characters.
+    """
+    if value is None:
+        return ""
+    kind = type(value)
+    if kind is int or kind is float or kind is bool:
+        return str(value)
+    if kind is str:
+        text = value
+    elif isinstance(value, str):
+        # Like csv.writer, use the text of str subclasses (e.g. StrEnum
+        # members) rather than their __str__.
+        text = str.__str__(value)
+    else:
+        text = str(value)
+    if _CSV_SPECIAL.search(text):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _fsync(path: str) -> None:
+    """
+    Flush one file or directory to stable storage.
+
+    Args:
+        path (str): File or directory to flush.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _chunked(iterable: Iterable[Any], n: int) -> Iterable[List[Any]]:
+    """
+    Split an iterable into lists of at most `n` items.
+
+    Args:
+        iterable (Iterable[Any]): Items to split; consumed lazily.
+        n (int): Maximum chunk size.
+
+    Yields:
+        List[Any]: Next chunk of items.
+    """
+    it = iter(iterable)
+    while chunk := list(itertools.islice(it, n)):
+        yield chunk
 
 
 class FileSaver:
@@ -12,8 +123,15 @@ class FileSaver:
     Files are saved with automatically generated timestamps unless one is
     explicitly provided, and filenames follow the pattern:
     <source>_<timestamp>.<ext>
+
+    Writes are not fsynced as they happen. Callers that want the files of a
+    run on stable storage should call `FileSaver.finalize_batch()` once all
+    saves are done.
     """
 
+    _pending_lock = threading.Lock()
+    _pending = []
+
     def __init__(self, base_dir: Union[str, Path], timestamp: str = None):
         """
         Initialize the FileSaver.
@@ -24,67 +142,510 @@ class FileSaver:
                 If not provided, the current timestamp is used in the format
                 YYYY-MM-DDTHH-MM.
         """
-        self.timestamp = timestamp or datetime.now().strftime("%Y-%m-%dT%H-%M")
+        self.timestamp = timestamp if timestamp is not None else run_timestamp()
         self.path = Path(base_dir)
         self.path.mkdir(parents=True, exist_ok=True)
+        # Precomputed so building a filename is a single string format.
+        self._prefix = os.fspath(self.path) + os.sep
 
-    def _filename(self, source: str, ext: str) -> Path:
+    def _filename(self, source: str, ext: str, compress: str = None) -> str:
         """
         Construct a filename with timestamp and extension.
 
         Args:
             source (str): Base name of the file.
             ext (str): File extension (e.g., "json", "csv").
+            compress (str, optional): "gzip" or "zstd" to append the matching
+                ".gz" / ".zst" suffix.
 
         Returns:
-            Path: Full file path including directory and filename.
+            str: Full file path string including directory and filename.
+
+        Raises:
+            ValueError: If `compress` is not None, "gzip" or "zstd".
+            ImportError: If "zstd" is requested but `zstandard` is not installed.
+        """
+        if compress not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unsupported compression: {compress}")
+        if compress == "zstd" and zstandard is None:
+            raise ImportError("zstandard is required for zstd compression")
+        suffix = COMPRESSION_SUFFIXES[compress]
+        return f"{self._prefix}{source}_{self.timestamp}.{ext}{suffix}"
+
+    @contextlib.contextmanager
+    def _open_binary(self, path: str, compress: str = None, level: int = None):
         """
-        filename = f"{source}_{self.timestamp}.{ext}"
-        return self.path / filename
+        Open `path` for writing through a large buffered writer.
 
-    def save_json(self, source: str, data: Any) -> Path:
+        With `compress`, data is compressed inline on its way into the
+        buffered writer. Data goes to a uniquely named temporary sibling file
+        that replaces `path` atomically once the block exits without error, so
+        readers never see a partially written file and concurrent writers of
+        the same path never share one; on error the temporary file is removed.
+        Nothing is flushed or fsynced mid-write. The path is recorded so that
+        `finalize_batch` knows a sync is pending.
+
+        Args:
+            path (str): File to create or truncate.
+            compress (str, optional): "gzip" or "zstd". Defaults to None.
+            level (int, optional): Compression level. Defaults to 1 for gzip
+                (fast) and 3 for zstd.
+
+        Yields:
+            Writable binary file object.
+        """
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(path),
+            prefix=os.path.basename(path) + ".",
+            suffix=".tmp",
+        )
+        try:
+            with open(fd, "wb", buffering=WRITE_BUFFER_SIZE) as raw:
+                # mkstemp creates the file as 0o600; give it the mode a plain
+                # open() would, so outputs keep honouring the umask.
+                os.fchmod(fd, 0o666 & ~_UMASK)
+                if compress is None:
+                    yield raw
+                elif compress == "gzip":
+                    with gzip.GzipFile(
+                        fileobj=raw,
+                        mode="wb",
+                        compresslevel=1 if level is None else level,
+                    ) as gz:
+                        yield gz
+                else:
+                    compressor = zstandard.ZstdCompressor(
+                        level=3 if level is None else level
+                    )
+                    with compressor.stream_writer(raw, closefd=False) as zf:
+                        yield zf
+            os.replace(tmp_path, path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            raise
+        with FileSaver._pending_lock:
+            FileSaver._pending.append(path)
+
+    @contextlib.contextmanager
+    def _open_text(self, path: str, compress: str = None, level: int = None):
+        """
+        Open `path` for writing UTF-8 text (with `newline=""` for the csv module)
+        through the same buffered, optionally compressed writer as `_open_binary`.
+
+        Args:
+            path (str): File to create or truncate.
+            compress (str, optional): "gzip" or "zstd". Defaults to None.
+            level (int, optional): Compression level. See `_open_binary`.
+
+        Yields:
+            io.TextIOWrapper: Writable text file object.
+        """
+        with self._open_binary(path, compress, level) as raw:
+            text = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+            try:
+                yield text
+            finally:
+                text.flush()
+                text.detach()
+
+    @classmethod
+    def finalize_batch(cls) -> int:
+        """
+        Flush every file written since the last call to stable storage.
+
+        Each pending file is fsynced once, then each directory holding one, so
+        the renames that published the files survive a crash as well. Only
+        this batch is flushed, not every filesystem on the machine.
+
+        Returns:
+            int: Number of files synced.
+        """
+        with cls._pending_lock:
+            paths = list(dict.fromkeys(cls._pending))
+            cls._pending.clear()
+        for path in paths:
+            _fsync(path)
+        # Directories can only be opened for fsync on POSIX.
+        if os.name == "posix":
+            for directory in dict.fromkeys(map(os.path.dirname, paths)):
+                _fsync(directory)
+        return len(paths)
+
+    def save_json(
+        self,
+        source: str,
+        data: Any,
+        pretty: bool = False,
+        compress: str = None,
+        level: int = None,
+    ) -> str:
         """
         Save data to a JSON file.
 
-        The file will be stored as <source>_<timestamp>.json.
+        The file will be stored as <source>_<timestamp>.json, with a ".gz" or
+        ".zst" suffix when compressed. With orjson the document is encoded in
+        one pass and written with a single buffered write (ujson is used the
+        same way if orjson is missing); otherwise, or if the fast encoder
+        rejects the data, stdlib `json.dump` streams into a 1 MiB write
+        buffer. Compression happens inline on the way to
+        disk. Output is compact UTF-8 unless `pretty` is set.
 
         Args:
             source (str): Name used to generate the filename.
             data (Any): Serializable data to write to JSON.
+            pretty (bool): Indent the output by two spaces. Defaults to False.
+            compress (str, optional): "gzip" or "zstd" to compress the output.
+                Defaults to None (uncompressed).
+            level (int, optional): Compression level. Defaults to 1 for gzip
+                and 3 for zstd.
+
+        Returns:
+            str: Path of the written file.
+
+        Raises:
+            ValueError: If `compress` is not None, "gzip" or "zstd".
+            ImportError: If zstd compression is requested but `zstandard` is
+                not installed.
+        """
+        path = self._filename(source, "json", compress)
+        buf = None
+        try:
+            if orjson is not None:
+                option = orjson.OPT_NON_STR_KEYS
+                if pretty:
+                    option |= orjson.OPT_INDENT_2
+                buf = orjson.dumps(data, option=option)
+            elif ujson is not None:
+                buf = ujson.dumps(
+                    data,
+                    ensure_ascii=False,
+                    escape_forward_slashes=False,
+                    indent=2 if pretty else 0,
+                ).encode("utf-8")
+        except (TypeError, OverflowError):
+            # Data the fast encoders reject but `json` accepts, such as
+            # integers wider than 64 bits, goes through the stdlib path.
+            buf = None
+        if buf is None:
+            dump_kwargs = {"ensure_ascii": False}
+            if pretty:
+                dump_kwargs["indent"] = 2
+            else:
+                dump_kwargs["separators"] = (",", ":")
+            # Stream the encoder's chunks into the large write buffer rather
+            # than building the whole document as one string.
+            with self._open_text(path, compress, level) as f:
+                json.dump(data, f, **dump_kwargs)
+            return path
+
+        with self._open_binary(path, compress, level) as f:
+            f.write(buf)
+        return path
+
+    def save_json_stream(self, source: str, items: Iterable[Any]) -> str:
+        """
+        Stream an iterable to a compact JSON array, one item at a time.
+
+        The file will be stored as <source>_<timestamp>.json. Each item is
+        encoded on its own (with orjson when available) straight into the
+        write buffer, so memory use does not grow with the number of items
+        and `items` may be a generator.
+
+        Args:
+            source (str): Name used to generate the filename.
+            items (Iterable[Any]): Serializable items for the array.
 
         Returns:
-            Path: Path to the written file.
+            str: Path of the written file.
         """
+
+        def encode_stdlib(item):
+            return json.dumps(item, ensure_ascii=False, separators=(",", ":")).encode(
+                "utf-8"
+            )
+
+        if orjson is not None:
+
+            def encode(item):
+                try:
+                    return orjson.dumps(item, option=orjson.OPT_NON_STR_KEYS)
+                except TypeError:
+                    return encode_stdlib(item)
+
+        else:
+            encode = encode_stdlib
+
         path = self._filename(source, "json")
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        with self._open_binary(path) as f:
+            f.write(b"[")
+            for i, item in enumerate(items):
+                if i:
+                    f.write(b",")
+                f.write(encode(item))
+            f.write(b"]")
         return path
 
-    def save_csv(self, source: str, rows: List[Dict[str, Any]]) -> Path:
+    def save_text(self, source: str, text: str, ext: str = "json") -> str:
         """
-        Save a list of dictionaries as a CSV file.
+        Save an already-serialized document to a UTF-8 text file.
 
-        The file will be stored as <source>_<timestamp>.csv.
+        The file will be stored as <source>_<timestamp>.<ext>. Useful when the
+        content was produced elsewhere (e.g. JSON from protobuf) and should not
+        be round-tripped through `json.dump`.
 
         Args:
-            rows (List[Dict[str, Any]]): Non-empty list of dictionaries to write.
             source (str): Name used to generate the filename.
+            text (str): Document to write.
+            ext (str): File extension. Defaults to "json".
 
         Returns:
-            Path: Path to the written file.
+            str: Path of the written file.
+        """
+        path = self._filename(source, ext)
+        with self._open_binary(path) as f:
+            f.write(text.encode("utf-8"))
+        return path
+
+    def save_bytes(self, source: str, ext: str, data: bytes) -> str:
+        """
+        Save raw bytes to a file without any re-encoding.
+
+        The file will be stored as <source>_<timestamp>.<ext>.
+
+        Args:
+            source (str): Name used to generate the filename.
+            ext (str): File extension (e.g., "pb").
+            data (bytes): Bytes to write.
+
+        Returns:
+            str: Path of the written file.
+        """
+        path = self._filename(source, ext)
+        with self._open_binary(path) as f:
+            f.write(data)
+        return path
+
+    def save_msgpack(self, source: str, data: Any) -> str:
+        """
+        Save data as a MessagePack file.
+
+        The file will be stored as <source>_<timestamp>.msgpack. MessagePack
+        holds the same structures as JSON in a smaller binary encoding that is
+        faster to read back. Requires `msgpack`.
+
+        Args:
+            source (str): Name used to generate the filename.
+            data (Any): Serializable data to write.
+
+        Returns:
+            str: Path of the written file.
 
         Raises:
-            ValueError: If `rows` is empty.
+            ImportError: If `msgpack` is not installed.
         """
-        if not rows:
-            raise ValueError("rows cannot be empty")
+        if msgpack is None:
+            raise ImportError("msgpack is required to save MessagePack files")
 
-        path = self._filename(source, "csv")
-        fieldnames = rows[0].keys()
+        path = self._filename(source, "msgpack")
+        with self._open_binary(path) as f:
+            f.write(msgpack.packb(data, use_bin_type=True))
+        return path
+
+    def save_parquet(
+        self,
+        source: str,
+        arrays: Union[Dict[str, List[Any]], List[Dict[str, Any]]],
+        types: Dict[str, str] = None,
+    ) -> str:
+        """
+        Save tabular data as a zstd-compressed Parquet file.
+
+        The file will be stored as <source>_<timestamp>.parquet. Requires
+        `pyarrow`.
+
+        Args:
+            source (str): Name used to generate the filename.
+            arrays (Union[Dict[str, List[Any]], List[Dict[str, Any]]]): Either
+                column name to equal-length column values, or a list of rows
+                sharing the keys of the first row.
+            types (Dict[str, str], optional): Column name to Arrow type alias
+                (e.g. "float32", "uint32"). Columns not listed are inferred.
+
+        Returns:
+            str: Path of the written file.
+
+        Raises:
+            ImportError: If `pyarrow` is not installed.
+        """
+        if pyarrow is None:
+            raise ImportError("pyarrow is required to save Parquet files")
 
-        with open(path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
+        if not isinstance(arrays, Mapping):
+            names = list(arrays[0]) if arrays else []
+            arrays = {name: [row.get(name) for row in arrays] for name in names}
 
+        types = types or {}
+        table = pyarrow.table(
+            {
+                name: pyarrow.array(values, type=types.get(name))
+                for name, values in arrays.items()
+            }
+        )
+
+        path = self._filename(source, "parquet")
+        with self._open_binary(path) as f:
+            pyarrow.parquet.write_table(table, f, compression="zstd")
+        return path
+
+    def save_csv(
+        self,
+        source: str,
+        rows: Iterable[Union[Sequence[Any], Mapping[str, Any]]],
+        fieldnames: Sequence[str] = None,
+        fast: bool = False,
+        compress: str = None,
+        level: int = None,
+    ) -> str:
+        """
+        Stream rows to a CSV file with columns in `fieldnames` order.
+
+        The file will be stored as <source>_<timestamp>.csv, with a ".gz" or
+        ".zst" suffix when compressed. Rows may be sequences of values in
+        header order, or dicts keyed by field name. Dict rows are converted
+        with one prebuilt `operator.itemgetter`, and everything is written
+        with a plain `csv.writer` through a large buffer, so there is no
+        per-row DictWriter overhead. `rows` may be a generator; it is consumed
+        in chunks of `CSV_CHUNK_ROWS`, so memory use does not grow with the
+        number of rows. Passing `fieldnames` explicitly fixes the schema
+        up front; for dict rows it may be omitted, in which case the keys of
+        the first row are used.
+
+        With `fast=True` the csv module is bypassed: each row is joined with
+        plain string formatting, quoting only fields that need it, and
+        formatted rows are written in multi-megabyte batches. The output is
+        byte-for-byte the same as the default path.
+
+        Args:
+            source (str): Name used to generate the filename.
+            rows (Iterable[Union[Sequence[Any], Mapping[str, Any]]]): Rows to
+                write. All rows must be the same kind.
+            fieldnames (Sequence[str], optional): Header row. Required for
+                sequence rows.
+            fast (bool): Use the string-formatting writer. Defaults to False.
+            compress (str, optional): "gzip" or "zstd" to compress the output.
+                Defaults to None (uncompressed).
+            level (int, optional): Compression level. Defaults to 1 for gzip
+                and 3 for zstd.
+
+        Returns:
+            str: Path of the written file.
+
+        Raises:
+            ValueError: If `fieldnames` is omitted and `rows` is empty or holds
+                sequences, if there are no fields (e.g. the first dict row is
+                empty), or if `compress` is not None, "gzip" or "zstd".
+            ImportError: If zstd compression is requested but `zstandard` is
+                not installed.
+        """
+        rows = iter(rows)
+        first = next(rows, None)
+        if fieldnames is None:
+            if first is None:
+                raise ValueError("rows cannot be empty when fieldnames is omitted")
+            if not isinstance(first, Mapping):
+                raise ValueError("fieldnames is required for sequence rows")
+            fieldnames = list(first)
+        if not fieldnames:
+            raise ValueError("fieldnames cannot be empty")
+        if first is not None:
+            rows = itertools.chain((first,), rows)
+            if isinstance(first, Mapping):
+                getter = operator.itemgetter(*fieldnames)
+                if len(fieldnames) == 1:
+                    rows = ((getter(r),) for r in rows)
+                else:
+                    rows = map(getter, rows)
+
+        path = self._filename(source, "csv", compress)
+        if fast:
+            with self._open_text(path, compress, level) as f:
+                f.write(",".join(map(_csv_field, fieldnames)) + "\r\n")
+                parts, size = [], 0
+                for row in rows:
+                    line = ",".join(map(_csv_field, row))
+                    if not line and len(row) == 1:
+                        # csv.writer quotes a lone empty field so the row is not blank.
+                        line = '""'
+                    parts.append(line)
+                    size += len(line) + 2
+                    if size >= FAST_CSV_FLUSH_CHARS:
+                        parts.append("")
+                        f.write("\r\n".join(parts))
+                        parts, size = [], 0
+                if parts:
+                    parts.append("")
+                    f.write("\r\n".join(parts))
+            return path
+
+        with self._open_text(path, compress, level) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            for chunk in _chunked(rows, CSV_CHUNK_ROWS):
+                writer.writerows(chunk)
+        return path
+
+    def save_csv_arrow(
+        self,
+        source: str,
+        rows: Sequence[Mapping[str, Any]],
+        fieldnames: Sequence[str] = None,
+    ) -> str:
+        """
+        Save a large batch of dict rows as CSV using pyarrow's C++ writer.
+
+        The file will be stored as <source>_<timestamp>.csv. pyarrow formats
+        the data column by column and releases the GIL, which is much faster
+        than the csv module for big batches. This falls back to `save_csv`
+        below `ARROW_CSV_MIN_ROWS` rows (where building an Arrow table is not
+        worth it), without `pyarrow`, when `rows` is not a sequence (e.g. a
+        generator), or when a column mixes types Arrow cannot unify.
+
+        The two writers produce different text for the same values, so the
+        format depends on which one handles the batch. pyarrow quotes the
+        header and every string value, formats numbers and booleans its own
+        way (e.g. `1.0` as `1`, `True` as `true`), and ends lines with `\n`
+        rather than `\r\n`. Both parse back to the same rows.
+
+        Args:
+            source (str): Name used to generate the filename.
+            rows (Sequence[Mapping[str, Any]]): Rows sharing the same keys.
+            fieldnames (Sequence[str], optional): Columns to write, in order.
+                Defaults to the keys of the first row.
+
+        Returns:
+            str: Path of the written file.
+
+        Raises:
+            ValueError: If `rows` is empty and `fieldnames` is omitted.
+        """
+        if (
+            pyarrow is None
+            or not isinstance(rows, Sequence)
+            or len(rows) < ARROW_CSV_MIN_ROWS
+        ):
+            return self.save_csv(source, rows, fieldnames=fieldnames)
+
+        try:
+            table = pyarrow.Table.from_pylist(rows)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+            return self.save_csv(source, rows, fieldnames=fieldnames)
+        if fieldnames is not None:
+            table = table.select(list(fieldnames))
+
+        path = self._filename(source, "csv")
+        with self._open_binary(path) as f:
+            pyarrow.csv.write_csv(
+                table, f, pyarrow.csv.WriteOptions(quoting_style="needed")
+            )
         return path
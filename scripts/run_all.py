@@ -0,0 +1,142 @@
+import asyncio
+import logging
+import aiohttp
+import fetch_realtime
+import fetch_static
+from utils import run_timestamp
+
+logger = logging.getLogger("RunAll")
+
+# Attempts per stage, and the first retry delay in seconds (doubled each retry).
+RETRY_TRIES = 3
+RETRY_BASE_DELAY = 0.5
+
+
+def _is_transient(exc):
+    """
+    Tell whether a stage error is worth retrying.
+
+    Network failures, timeouts, and 5xx responses are transient. Other 4xx
+    responses (e.g. an invalid API key) and programming errors are not.
+
+    Args:
+        exc (BaseException): Error raised by a stage attempt.
+
+    Returns:
+        bool: True if the stage should be retried.
+    """
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status >= 500
+    return isinstance(
+        exc,
+        (
+            aiohttp.ClientConnectionError,
+            aiohttp.ClientPayloadError,
+            asyncio.TimeoutError,
+            ConnectionError,
+        ),
+    )
+
+
+def _describe(exc):
+    """
+    Summarize an error for a log line without its message.
+
+    aiohttp error messages include the request URL, which carries the API
+    key, so only the error type and HTTP status (if any) are reported.
+
+    Args:
+        exc (BaseException): Error to describe.
+
+    Returns:
+        str: e.g. "ClientResponseError 503" or "TimeoutError".
+    """
+    status = getattr(exc, "status", None)
+    name = type(exc).__name__
+    return f"{name} {status}" if status is not None else name
+
+
+async def _run_with_retry_async(fn, *args, tries=RETRY_TRIES, base=RETRY_BASE_DELAY):
+    """
+    Await `fn(*args)`, retrying transient failures with exponential backoff.
+
+    No time limit is applied here: the stages bound their own network requests
+    (see `fetch_static.DOWNLOAD_TIMEOUT` and `fetch_realtime.FETCH_TIMEOUT`).
+    Cancelling a stage from outside would not stop the parsing, saving and
+    extraction it runs in worker threads, so an attempt always finishes
+    before the next one starts.
+
+    Args:
+        fn (Callable[..., Awaitable]): Coroutine function to run.
+        *args: Positional arguments for `fn`.
+        tries (int): Maximum number of attempts.
+        base (float): Delay before the first retry, in seconds.
+
+    Returns:
+        Any: Result of the first successful attempt.
+
+    Raises:
+        Exception: The error from the last attempt if all attempts fail, or
+            the first error that is not transient.
+    """
+    for attempt in range(tries):
+        try:
+            return await fn(*args)
+        except Exception as e:
+            if attempt == tries - 1 or not _is_transient(e):
+                raise
+            delay = base * 2**attempt
+            logger.warning(
+                f"{fn.__module__}.{fn.__name__} failed ({_describe(e)}); "
+                f"retrying in {delay}s"
+            )
+            await asyncio.sleep(delay)
+
+
+def _raise_first(results):
+    """
+    Re-raise the first exception among stage results, if any.
+
+    Args:
+        results (list): Stage results, possibly containing exceptions.
+
+    Raises:
+        Exception: The first exception found in `results`.
+    """
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
+async def run_all(timestamp=None):
+    """
+    Fetch the static GTFS feed and all realtime feeds in one event loop.
+
+    The static download and the three realtime downloads share a single
+    aiohttp session and are gathered concurrently, so the run takes roughly
+    as long as the slowest download rather than the sum of all four. Every
+    request has an overall timeout, and stages that fail with a transient
+    error are retried with backoff. A stage that still fails does not stop the other from
+    finishing; its error is raised afterwards.
+
+    Args:
+        timestamp (str | None): Optional timestamp override shared by every
+            output. If not provided, the current time is used.
+
+    Side Effects:
+        Creates log files, fetches remote data, and writes static and realtime
+        output.
+    """
+    now = timestamp or run_timestamp()
+    connector = aiohttp.TCPConnector(limit=8, keepalive_timeout=30)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        results = await asyncio.gather(
+            _run_with_retry_async(fetch_static.run_async, session, now),
+            _run_with_retry_async(fetch_realtime.run_async, session, now),
+            return_exceptions=True,
+        )
+    _raise_first(results)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_all())
@@ -1,4 +1,17 @@
 import logging
+import re
+import time
+from functools import lru_cache
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Upper bound on distinct strings kept by `intern_str`.
+INTERN_CACHE_SIZE = 10_000
+# Format of the run timestamp used in output and log file names.
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H-%M"
 
 
 class LogObfuscator(logging.Filter):
@@ -10,14 +23,61 @@ class LogObfuscator(logging.Filter):
     It is useful for preventing sensitive information such as passwords or
     tokens from appearing directly in log output.
 
+    When `pyahocorasick` is installed, keywords are matched with an
+    Aho-Corasick automaton, which scans each message once regardless of how
+    many keywords there are; otherwise a precompiled regex is used.
+
     Note:
         The filter modifies only the `msg` attribute of the log record. If the
         logger uses formatting arguments (e.g., logger.info("User %s", name)),
-        sensitive data passed via `record.args` will NOT be obfuscated.
+        sensitive data passed via `record.args` will NOT be obfuscated. Use
+        `ObfuscatingFormatter` when that matters.
     """
 
     def __init__(self, keywords):
         self.keywords = keywords
+        unique = {k for k in keywords if k}
+        # Single-character keywords are replaced in one str.translate pass.
+        singles = {k for k in unique if len(k) == 1}
+        self._table = str.maketrans({c: "***" for c in singles}) if singles else None
+        # The rest form one alternation scanned in a single pass; longest
+        # keywords first so a keyword that is a prefix of another cannot
+        # shadow it.
+        words = sorted(unique - singles, key=len, reverse=True)
+        self._pattern = re.compile("|".join(map(re.escape, words))) if words else None
+        # Messages containing none of these characters cannot match.
+        self._first_chars = frozenset(k[0] for k in unique)
+        self._automaton = None
+        if words and ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for word in words:
+                self._automaton.add_word(word, len(word))
+            self._automaton.make_automaton()
+
+    def _scrub_automaton(self, msg):
+        """
+        Replace keywords in `msg` using the Aho-Corasick automaton.
+
+        Matches are leftmost-longest and non-overlapping, the same as the
+        regex path.
+
+        Args:
+            msg (str): Message to scrub.
+
+        Returns:
+            str: Message with every keyword replaced by "***".
+        """
+        parts = []
+        pos = 0
+        for end, length in self._automaton.iter_long(msg):
+            start = end - length + 1
+            parts.append(msg[pos:start])
+            parts.append("***")
+            pos = end + 1
+        if not parts:
+            return msg
+        parts.append(msg[pos:])
+        return "".join(parts)
 
     def filter(self, record):
         """
@@ -25,7 +85,11 @@ class LogObfuscator(logging.Filter):
 
         This replaces all occurrences of the configured keywords found in
         the raw message (`record.msg`) before the record is processed by
-        the rest of the logging pipeline.
+        the rest of the logging pipeline. Non-string messages are left as-is,
+        and messages that contain none of the keywords' first characters are
+        skipped without scanning for keywords. A record already scrubbed by
+        this filter (e.g. when it is shared by several handlers) is not
+        scanned again.
 
         Args:
             record (logging.LogRecord): The log record being processed.
@@ -34,9 +98,96 @@ class LogObfuscator(logging.Filter):
             bool: Always returns True to ensure the record continues through
             the logging pipeline.
         """
-        if record.msg:
-            msg = record.msg
-            for word in self.keywords:
-                msg = msg.replace(word, "***")
-            record.msg = msg
+        # A record is filtered once per handler it reaches; scrub it only once.
+        if getattr(record, "_obfuscated_by", None) is self:
+            return True
+        if isinstance(record.msg, str):
+            record.msg = self.scrub(record.msg)
+            record._obfuscated_by = self
         return True
+
+    def scrub(self, msg):
+        """
+        Replace every configured keyword in `msg` with "***".
+
+        Args:
+            msg (str): Text to scrub.
+
+        Returns:
+            str: Scrubbed text (`msg` itself if nothing matched).
+        """
+        if self._first_chars.isdisjoint(msg):
+            return msg
+        # Multi-character keywords go first so a single-character keyword
+        # cannot break up a longer one before it is matched.
+        if self._automaton is not None:
+            msg = self._scrub_automaton(msg)
+        elif self._pattern is not None:
+            msg = self._pattern.sub("***", msg)
+        if self._table is not None:
+            msg = msg.translate(self._table)
+        return msg
+
+
+class ObfuscatingFormatter(logging.Formatter):
+    """
+    A logging formatter that obfuscates sensitive keywords in its output.
+
+    Unlike `LogObfuscator`, scrubbing runs on the fully formatted text, so
+    values passed through `record.args` and exception tracebacks are covered
+    too, and the work is only done for records a handler actually emits.
+    Prefer this over `LogObfuscator` for new handlers.
+
+    Args:
+        keywords (list[str]): Strings to replace with "***".
+        *args: Passed through to `logging.Formatter`.
+        **kwargs: Passed through to `logging.Formatter`.
+    """
+
+    def __init__(self, keywords, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._obfuscator = LogObfuscator(keywords)
+
+    def format(self, record):
+        """
+        Format the record, then obfuscate the resulting text.
+
+        Args:
+            record (logging.LogRecord): The log record being formatted.
+
+        Returns:
+            str: Formatted, obfuscated log line.
+        """
+        return self._obfuscator.scrub(super().format(record))
+
+
+@lru_cache(maxsize=INTERN_CACHE_SIZE)
+def intern_str(s):
+    """
+    Return a canonical instance of `s`.
+
+    Equal strings passed in return the same object, so IDs that repeat across
+    a feed (route, trip, stop and vehicle IDs) share one allocation in the
+    cleaned output. The cache is a bounded LRU, so memory stays capped in a
+    long-running process.
+
+    Args:
+        s (str): String to intern.
+
+    Returns:
+        str: The cached string equal to `s`.
+    """
+    return s
+
+
+def run_timestamp():
+    """
+    Return the current local time formatted for file names.
+
+    A run should call this once and pass the result down, so every output of
+    the run shares one timestamp.
+
+    Returns:
+        str: Current time as YYYY-MM-DDTHH-MM.
+    """
+    return time.strftime(TIMESTAMP_FORMAT)
@@ -0,0 +1,87 @@
+import csv
+import enum
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+from file_saver import FileSaver  # noqa: E402
+
+
+class _Str(str):
+    pass
+
+
+class _Color(str, enum.Enum):
+    RED = "r,e"
+
+
+CSV_VALUES = [
+    None,
+    "",
+    "plain",
+    " leading space",
+    "a,b",
+    'say "hi"',
+    "line\nbreak",
+    "carriage\rreturn",
+    _Str("a,b"),
+    _Color.RED,
+    ["x", "y"],
+    ("x",),
+    0,
+    -12,
+    1.5,
+    1e20,
+    float("nan"),
+    True,
+    False,
+]
+
+
+def _csv_writer_bytes(fieldnames, rows):
+    """Encode rows with the csv module, the reference for the fast path."""
+    buf = io.StringIO(newline="")
+    writer = csv.writer(buf)
+    writer.writerow(fieldnames)
+    writer.writerows(rows)
+    return buf.getvalue().encode("utf-8")
+
+
+@pytest.mark.parametrize("value", CSV_VALUES, ids=repr)
+def test_fast_csv_matches_csv_writer(tmp_path, value):
+    fieldnames = ["a", "b"]
+    rows = [(value, value), (value, "tail"), ("head", value)]
+    path = FileSaver(tmp_path, "t").save_csv("rows", rows, fieldnames, fast=True)
+    assert Path(path).read_bytes() == _csv_writer_bytes(fieldnames, rows)
+
+
+@pytest.mark.parametrize("row", [[], [None], [""], ["", ""]], ids=repr)
+def test_fast_csv_matches_csv_writer_for_empty_fields(tmp_path, row):
+    fieldnames = ["a"]
+    path = FileSaver(tmp_path, "t").save_csv("rows", [row], fieldnames, fast=True)
+    assert Path(path).read_bytes() == _csv_writer_bytes(fieldnames, [row])
+
+
+def test_fast_csv_matches_csv_writer_for_dict_rows(tmp_path):
+    rows = [dict(zip("abc", (v, _Str("q,r"), 7))) for v in CSV_VALUES]
+    path = FileSaver(tmp_path, "t").save_csv("rows", rows, fast=True)
+    expected = _csv_writer_bytes(list("abc"), [tuple(r.values()) for r in rows])
+    assert Path(path).read_bytes() == expected
+
+
+def test_csv_without_fields_raises(tmp_path):
+    with pytest.raises(ValueError, match="fieldnames cannot be empty"):
+        FileSaver(tmp_path, "t").save_csv("rows", [{}, {}])
+
+
+@pytest.mark.parametrize("data", [{1: 2}, {"big": 2**70}, [{None: -(2**65)}]], ids=repr)
+def test_json_accepts_what_stdlib_json_accepts(tmp_path, data):
+    saver = FileSaver(tmp_path, "t")
+    expected = json.loads(json.dumps(data))
+    assert json.loads(Path(saver.save_json("doc", data)).read_bytes()) == expected
+    assert json.loads(Path(saver.save_json_stream("items", [data])).read_bytes()) == [expected]